@@ -1,15 +1,19 @@
 import sys
 import os
-import fitz  # PyMuPDF
-from PyQt6.QtPrintSupport import QPrinter
+import queue
+import re
+import threading
+from collections import OrderedDict
 from PyQt6.QtWidgets import (
     QApplication, QDialog, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox, QRadioButton, QLineEdit, QPushButton,
-    QMessageBox, QScrollArea, QSpinBox, QWidget, QGroupBox, QDoubleSpinBox
+    QMessageBox, QScrollArea, QSpinBox, QWidget, QGroupBox, QDoubleSpinBox, QProgressBar
 )
 # --- MODIFICATION: Add necessary imports for Orientation and Icon ---
-from PyQt6.QtGui import QPixmap, QPageSize, QPainter, QImage, QIcon, QTransform, QPageLayout
-from PyQt6.QtCore import Qt, QRect, QSizeF
+from PyQt6.QtGui import QPixmap, QPageSize, QPainter, QImage, QIcon, QPageLayout
+from PyQt6.QtCore import (
+    Qt, QRectF, QSize, QSizeF, QTimer, QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+)
 
 
 # --- MODIFICATION: Use the definitive resource_path function for PyInstaller ---
@@ -24,6 +28,153 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+# Preview pixmaps are kept in a small LRU so paging back and forth or toggling
+# orientation does not re-rasterize pages MuPDF has already drawn.
+_PREVIEW_CACHE_MAX_ENTRIES = 32
+_PREVIEW_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Resize drags and orientation toggles are coalesced into a single re-render.
+_RENDER_DEBOUNCE_MS = 120
+
+# A page the preview has not seen yet is first painted from a cheap low-resolution
+# pass; the full-resolution render only runs once the user settles on the page.
+_PREVIEW_FAST_SCALE = 0.5
+_PREVIEW_DPI_MAX = 192
+_PREVIEW_UPGRADE_MS = 500
+
+_PAPER_SIZES = (
+    {'display': 'Letter (8.5 x 11.0 in)', 'id': QPageSize.PageSizeId.Letter},
+    {'display': 'Legal (8.5 x 14.0 in)', 'id': QPageSize.PageSizeId.Legal},
+    {'display': 'Legal (8.5 x 13.0 in)', 'id': None, 'size_in': QSizeF(8.5, 13.0)},
+    {'display': 'A4 (210 x 297 mm)', 'id': QPageSize.PageSizeId.A4},
+    {'display': 'A3 (297 x 420 mm)', 'id': QPageSize.PageSizeId.A3},
+    {'display': 'A5 (148 x 210 mm)', 'id': QPageSize.PageSizeId.A5},
+    {'display': 'Custom...', 'id': None}
+)
+_PAPER_DISPLAY_NAMES = tuple(p['display'] for p in _PAPER_SIZES)
+_PAPER_BY_DISPLAY = {p['display']: p for p in _PAPER_SIZES}
+
+# A single page ("3") or an inclusive range ("3-5") typed into the Custom Range field.
+_PAGE_RANGE_RE = re.compile(r'^\s*(\d+)(?:\s*-\s*(\d+))?\s*$')
+
+# Page layouts are rebuilt only when the paper/orientation selection changes.
+_PAGE_LAYOUT_CACHE_MAX = 32
+
+# MuPDF is not thread-safe: every call into the shared document, whether from a
+# preview worker or the print loop, has to hold this lock.
+_MUPDF_LOCK = threading.Lock()
+
+# Parsed pages are shared between the preview workers and the print loop, so a page
+# previewed and then printed only has its content stream parsed once.
+_PAGE_CACHE_MAX = 16
+
+# Printing rasterizes pages on a producer thread; at most this many rendered pages
+# wait for the painter at any time.
+_PRINT_PREFETCH_PAGES = 2
+
+
+def _put_unless_stopped(q, item, stop):
+    """Blocks on a bounded queue until there is room, giving up once `stop` is set."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _luminance_image(pix):
+    """Converts an RGB MuPDF pixmap to a Grayscale8 QImage using integer Rec. 601 luma weights."""
+    try:
+        import numpy as np
+    except ImportError:
+        return QImage(pix.samples_mv, pix.width, pix.height, pix.stride,
+                      QImage.Format.Format_RGB888).convertToFormat(QImage.Format.Format_Grayscale8)
+
+    rows = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.stride)
+    rgb = rows[:, :pix.width * pix.n].reshape(pix.height, pix.width, pix.n)[..., :3]
+    # 77/150/29 sum to 256, so the shift replaces a float divide
+    gray = ((rgb @ np.array([77, 150, 29], dtype=np.uint16)) >> 8).astype(np.uint8)
+    return QImage(gray.data, pix.width, pix.height, pix.width, QImage.Format.Format_Grayscale8).copy()
+
+
+class _LoaderThread(QThread):
+    """Opens the PDF off the GUI thread so the dialog can paint immediately."""
+    loaded = pyqtSignal(object, int, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+
+    def run(self):
+        try:
+            if self.file_path.lower().endswith('.pdf'):
+                # MuPDF is only mapped in here, so the window can appear before it is loaded
+                import fitz  # PyMuPDF
+
+                # The extension was already checked, so skip MuPDF's format sniffing
+                doc = fitz.open(self.file_path, filetype="pdf")
+            else:
+                raise ValueError("Unsupported file type")
+
+            # --- MODIFICATION: Always crop to content for best fit ---
+            # Resolved once here so preview and print never query page bounds again
+            clip_rects = []
+            for page in doc:
+                # The dialog may be dismissed mid-scan; bail out so done() is not kept waiting
+                if self.isInterruptionRequested():
+                    doc.close()
+                    return
+                content_box = page.bound()
+                clip_rects.append(content_box if not content_box.is_empty else page.rect)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.loaded.emit(doc, len(doc), clip_rects)
+
+
+class _PreviewSignals(QObject):
+    rendered = pyqtSignal(int, object, QImage)
+    failed = pyqtSignal(int, str)
+
+
+class _PreviewJob(QRunnable):
+    """Rasterizes one preview page on a QThreadPool worker."""
+
+    def __init__(self, signals, job_id, load_page, key, clip_rect):
+        super().__init__()
+        self.signals = signals
+        self.job_id = job_id
+        self.load_page = load_page
+        self.key = key
+        self.clip_rect = clip_rect
+
+    def run(self):
+        import fitz  # PyMuPDF
+
+        page_num, landscape, dpi = self.key
+        try:
+            with _MUPDF_LOCK:
+                page = self.load_page(page_num)
+
+                # Landscape is rotated by MuPDF itself, saving a second full-image resample in Qt
+                zoom = dpi / 72
+                mat = fitz.Matrix(zoom, zoom)
+                if landscape:
+                    mat.prerotate(90)
+
+                pix = page.get_pixmap(matrix=mat, clip=self.clip_rect, alpha=False)
+                # The QImage aliases the MuPDF buffer; copy() detaches it once before it leaves this thread
+                q_image = QImage(pix.samples_mv, pix.width, pix.height, pix.stride,
+                                 QImage.Format.Format_RGB888).copy()
+        except Exception as e:
+            self.signals.failed.emit(self.job_id, str(e))
+            return
+
+        self.signals.rendered.emit(self.job_id, self.key, q_image)
+
+
 class PrintDialog(QDialog):
     def __init__(self, file_path, parent=None):
         super().__init__(parent)
@@ -36,24 +187,35 @@ class PrintDialog(QDialog):
 
         self.file_path = file_path
         self.doc = None
+        self._loader = None
         self.total_pages = 0
         self.preview_pages = []
         self.current_preview_index = 0
-
-        self.paper_sizes = [
-            {'display': 'Letter (8.5 x 11.0 in)', 'id': QPageSize.PageSizeId.Letter},
-            {'display': 'Legal (8.5 x 14.0 in)', 'id': QPageSize.PageSizeId.Legal},
-            {'display': 'Legal (8.5 x 13.0 in)', 'id': None, 'size_in': QSizeF(8.5, 13.0)},
-            {'display': 'A4 (210 x 297 mm)', 'id': QPageSize.PageSizeId.A4},
-            {'display': 'A3 (297 x 420 mm)', 'id': QPageSize.PageSizeId.A3},
-            {'display': 'A5 (148 x 210 mm)', 'id': QPageSize.PageSizeId.A5},
-            {'display': 'Custom...', 'id': None}
-        ]
+        self._preview_cache = OrderedDict()
+        self._preview_cache_bytes = 0
+        self._clip_rects = []
+        self._page_cache = OrderedDict()
+        self._preview_job_id = 0
+        self._preview_signals = _PreviewSignals(self)
+        self._preview_signals.rendered.connect(self._on_preview_rendered)
+        self._preview_signals.failed.connect(self._on_preview_failed)
+
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(_RENDER_DEBOUNCE_MS)
+        self._render_timer.timeout.connect(self.render_current_preview_page)
+
+        self._pending_upgrade = None
+        self._upgrade_timer = QTimer(self)
+        self._upgrade_timer.setSingleShot(True)
+        self._upgrade_timer.setInterval(_PREVIEW_UPGRADE_MS)
+        self._upgrade_timer.timeout.connect(self._upgrade_preview)
+
+        self._page_layouts = {}
 
         self.setWindowTitle("Professional Print Utility")
         self.setGeometry(150, 150, 900, 700)
 
-        self.load_document()
         self.init_ui()
 
         self.update_dpi_list()
@@ -68,6 +230,7 @@ class PrintDialog(QDialog):
         self.print_button = QPushButton("Print Document")
         self.print_button.setObjectName("printButton")
         self.print_button.clicked.connect(self.execute_print)
+        self.print_button.setEnabled(False)
         top_bar_layout.addStretch()
         top_bar_layout.addWidget(self.print_button)
 
@@ -94,12 +257,12 @@ class PrintDialog(QDialog):
         # --- MODIFICATION: Add Orientation UI Element ---
         self.orientation_combo = QComboBox()
         self.orientation_combo.addItems(["Portrait", "Landscape"])
-        self.orientation_combo.currentTextChanged.connect(self.render_current_preview_page)
+        self.orientation_combo.currentTextChanged.connect(lambda _: self._render_timer.start())
         controls_layout.addWidget(QLabel("Orientation:"))
         controls_layout.addWidget(self.orientation_combo)
 
         self.paper_size_combo = QComboBox()
-        self.paper_size_combo.addItems([p['display'] for p in self.paper_sizes])
+        self.paper_size_combo.addItems(_PAPER_DISPLAY_NAMES)
         self.paper_size_combo.currentTextChanged.connect(self.on_paper_size_changed)
         controls_layout.addWidget(QLabel("Paper Size:"))
         controls_layout.addWidget(self.paper_size_combo)
@@ -188,9 +351,6 @@ class PrintDialog(QDialog):
         main_layout.addLayout(top_bar_layout)
         main_layout.addLayout(content_layout)
 
-        from PyQt6.QtPrintSupport import QPrinterInfo
-        self.printer_combo.addItems(QPrinterInfo.availablePrinterNames())
-
     def on_paper_size_changed(self, text):
         if text == "Custom...":
             self.custom_size_widget.show()
@@ -203,6 +363,8 @@ class PrintDialog(QDialog):
         loading_dialog.setWindowTitle("Processing...")
         loading_dialog.setLayout(QVBoxLayout())
         loading_dialog.layout().addWidget(QLabel("Sending document to printer, please wait..."))
+        progress_bar = QProgressBar()
+        loading_dialog.layout().addWidget(progress_bar)
         loading_dialog.setFixedSize(300, 100)
         loading_dialog.show()
         QApplication.processEvents()
@@ -214,30 +376,15 @@ class PrintDialog(QDialog):
             printer.setCopyCount(self.copies_spinbox.value())
 
             # --- MODIFICATION: Use QPageLayout to set Orientation and Page Size ---
-            page_layout = QPageLayout()
-
-            if self.orientation_combo.currentText() == "Landscape":
-                page_layout.setOrientation(QPageLayout.Orientation.Landscape)
-            else:
-                page_layout.setOrientation(QPageLayout.Orientation.Portrait)
-
             selected_paper_text = self.paper_size_combo.currentText()
+            landscape = self.orientation_combo.currentText() == "Landscape"
             if selected_paper_text == "Custom...":
-                width = self.custom_width_input.value()
-                height = self.custom_height_input.value()
-                unit_text = self.custom_unit_combo.currentText()
-                unit = QPageSize.Unit.Inch if unit_text == "Inches" else QPageSize.Unit.Millimeter
-                custom_size_f = QSizeF(width, height)
-                page_size = QPageSize(custom_size_f, unit, "Custom")
-                page_layout.setPageSize(page_size)
+                page_layout = self._build_page_layout(selected_paper_text, landscape,
+                                                      self.custom_width_input.value(),
+                                                      self.custom_height_input.value(),
+                                                      self.custom_unit_combo.currentText())
             else:
-                paper_info = next((p for p in self.paper_sizes if p['display'] == selected_paper_text), None)
-                if paper_info:
-                    if paper_info['id'] is not None:
-                        page_layout.setPageSize(QPageSize(paper_info['id']))
-                    elif 'size_in' in paper_info:
-                        page_size = QPageSize(paper_info['size_in'], QPageSize.Unit.Inch)
-                        page_layout.setPageSize(page_size)
+                page_layout = self._build_page_layout(selected_paper_text, landscape, None, None, None)
 
             printer.setPageLayout(page_layout)
             # --- End of Modification ---
@@ -252,53 +399,111 @@ class PrintDialog(QDialog):
             else:
                 printer.setColorMode(QPrinter.ColorMode.Color)
 
-            self.process_and_print(printer)
+            self.process_and_print(printer, progress_bar)
 
         finally:
             loading_dialog.close()
 
-    # This is your working, stable print logic. It remains unchanged.
-    def process_and_print(self, printer):
+    def _build_page_layout(self, paper_display, landscape, width, height, unit_text):
+        """Returns the QPageLayout for a paper/orientation selection, reusing previously built ones."""
+        key = (paper_display, landscape, width, height, unit_text)
+        page_layout = self._page_layouts.get(key)
+        if page_layout is not None:
+            return page_layout
+
+        page_layout = QPageLayout()
+
+        if landscape:
+            page_layout.setOrientation(QPageLayout.Orientation.Landscape)
+        else:
+            page_layout.setOrientation(QPageLayout.Orientation.Portrait)
+
+        if paper_display == "Custom...":
+            unit = QPageSize.Unit.Inch if unit_text == "Inches" else QPageSize.Unit.Millimeter
+            custom_size_f = QSizeF(width, height)
+            page_size = QPageSize(custom_size_f, unit, "Custom")
+            page_layout.setPageSize(page_size)
+        else:
+            paper_info = _PAPER_BY_DISPLAY.get(paper_display)
+            if paper_info:
+                if paper_info['id'] is not None:
+                    page_layout.setPageSize(QPageSize(paper_info['id']))
+                elif 'size_in' in paper_info:
+                    page_size = QPageSize(paper_info['size_in'], QPageSize.Unit.Inch)
+                    page_layout.setPageSize(page_size)
+
+        if len(self._page_layouts) >= _PAGE_LAYOUT_CACHE_MAX:
+            self._page_layouts.clear()
+        self._page_layouts[key] = page_layout
+        return page_layout
+
+    def process_and_print(self, printer, progress_bar=None):
         pages_to_print = self.preview_pages
         if not pages_to_print:
             QMessageBox.warning(self, "No Pages Selected", "There are no valid pages selected to print.")
             return
 
+        from PyQt6.QtPrintSupport import QPrinter
         painter = QPainter()
         if not painter.begin(printer):
             QMessageBox.critical(self, "Print Error", "Could not start the printer. Check connection and drivers.")
             return
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
 
         print_dpi = printer.resolution()
+        page_rect = printer.pageRect(QPrinter.Unit.DevicePixel)
+        target_size = page_rect.size()
+        base_w = page_rect.width()
+        base_h = page_rect.height()
+        grayscale = self.color_mode_combo.currentText() == "Grayscale"
+        img_fmt = QImage.Format.Format_Grayscale8 if grayscale else QImage.Format.Format_RGB888
+
+        if progress_bar is not None:
+            progress_bar.setRange(0, len(pages_to_print))
+            progress_bar.setValue(0)
+
+        # Page N+1 is rasterized on the producer thread while page N is being drawn here
+        rendered = queue.Queue(maxsize=_PRINT_PREFETCH_PAGES)
+        stop = threading.Event()
+        producer = threading.Thread(target=self._render_print_pages,
+                                    args=(pages_to_print, print_dpi, grayscale, rendered, stop),
+                                    daemon=True)
+        producer.start()
 
         try:
-            for i, page_num in enumerate(pages_to_print):
-                page = self.doc.load_page(page_num)
-
-                # --- MODIFICATION: Always crop to content for best fit ---
-                content_box = page.bound()
-                clip_rect = content_box if not content_box.is_empty else page.rect
-
-                pix = page.get_pixmap(dpi=print_dpi, clip=clip_rect, alpha=False)
-                q_image = QImage(pix.samples, pix.width, pix.height, pix.stride,
-                                 QImage.Format.Format_RGB888 if pix.n > 1 else QImage.Format.Format_Grayscale8)
+            for i in range(len(pages_to_print)):
+                pix = rendered.get()
+                if isinstance(pix, Exception):
+                    raise pix
+
+                # Zero-copy view of the MuPDF buffer: `pix` must stay bound until drawImage is done
+                if grayscale and pix.n != 1:
+                    # MuPDF could not emit grayscale directly, convert the RGB samples ourselves
+                    q_image = _luminance_image(pix)
+                else:
+                    q_image = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, img_fmt)
 
-                if q_image.isNull():
-                    continue
+                drawn = not q_image.isNull()
+                if drawn:
+                    # Fit-to-page in float coordinates; the resampling itself is left to Qt/the driver
+                    scaled_size = QSizeF(q_image.size()).scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio)
 
-                page_rect = printer.pageRect(QPrinter.Unit.DevicePixel)
-                target_size = page_rect.size().toSize()
-                scaled_size = q_image.size().scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio)
+                    x = (base_w - scaled_size.width()) / 2
+                    y = (base_h - scaled_size.height()) / 2
 
-                x = (page_rect.width() - scaled_size.width()) / 2
-                y = (page_rect.height() - scaled_size.height()) / 2
+                    target_rect = QRectF(x, y, scaled_size.width(), scaled_size.height())
+                    painter.drawImage(target_rect, q_image)
 
-                target_rect = QRect(int(x), int(y), scaled_size.width(), scaled_size.height())
-                painter.drawImage(target_rect, q_image)
+                # Drop the page bitmap now rather than when the next page rebinds these names
+                q_image = pix = None
 
-                if i < len(pages_to_print) - 1:
+                if drawn and i < len(pages_to_print) - 1:
                     printer.newPage()
 
+                if progress_bar is not None:
+                    progress_bar.setValue(i + 1)
+                    QApplication.processEvents()
+
             painter.end()
             QMessageBox.information(self, "Success", "Document has been sent to the printer.")
 
@@ -307,10 +512,45 @@ class PrintDialog(QDialog):
             if painter.isActive():
                 painter.end()
 
+        finally:
+            stop.set()
+            producer.join()
+
+    def _render_print_pages(self, pages, dpi, grayscale, rendered, stop):
+        """Producer side of the print pipeline: rasterizes pages ahead of the painter."""
+        import fitz  # PyMuPDF
+
+        colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+        try:
+            for page_num in pages:
+                with _MUPDF_LOCK:
+                    page = self._load_page(page_num)
+                    clip_rect = self._clip_rects[page_num]
+
+                    pix = page.get_pixmap(dpi=dpi, clip=clip_rect, alpha=False, colorspace=colorspace)
+
+                if not _put_unless_stopped(rendered, pix, stop):
+                    return
+        except Exception as e:
+            _put_unless_stopped(rendered, e, stop)
+
+    def _load_page(self, page_num):
+        """Returns a parsed page, reusing recently loaded ones. Callers must hold _MUPDF_LOCK."""
+        page = self._page_cache.get(page_num)
+        if page is not None:
+            self._page_cache.move_to_end(page_num)
+            return page
+
+        page = self.doc.load_page(page_num)
+        self._page_cache[page_num] = page
+        if len(self._page_cache) > _PAGE_CACHE_MAX:
+            self._page_cache.popitem(last=False)
+        return page
+
     def update_dpi_list(self):
-        from PyQt6.QtPrintSupport import QPrinterInfo
         printer_name = self.printer_combo.currentText()
         if not printer_name: return
+        from PyQt6.QtPrintSupport import QPrinterInfo
         printer_info = QPrinterInfo(QPrinterInfo.printerInfo(printer_name))
         supported_resolutions = printer_info.supportedResolutions()
         self.dpi_combo.clear()
@@ -325,20 +565,19 @@ class PrintDialog(QDialog):
             self.dpi_combo.setCurrentText("300")
 
     def update_preview_range(self):
-        self.preview_pages = []
-        try:
-            if self.all_pages_radio.isChecked() or not self.page_range_edit.text():
-                self.preview_pages = list(range(self.total_pages))
+        if self.all_pages_radio.isChecked() or not self.page_range_edit.text():
+            self.preview_pages = list(range(self.total_pages))
+        else:
+            match = _PAGE_RANGE_RE.match(self.page_range_edit.text())
+            if match is None:
+                self.preview_pages = []
+            elif match.group(2) is None:
+                page = int(match.group(1)) - 1
+                self.preview_pages = [page] if 0 <= page < self.total_pages else []
             else:
-                range_text = self.page_range_edit.text().strip()
-                if '-' in range_text:
-                    start, end = map(int, range_text.split('-'))
-                    self.preview_pages = list(range(start - 1, end))
-                else:
-                    self.preview_pages = [int(range_text) - 1]
-            self.preview_pages = [p for p in self.preview_pages if 0 <= p < self.total_pages]
-        except ValueError:
-            self.preview_pages = []
+                start = max(0, int(match.group(1)) - 1)
+                end = min(self.total_pages, int(match.group(2)))
+                self.preview_pages = list(range(start, end))
         self.current_preview_index = 0
         self.render_current_preview_page()
 
@@ -348,41 +587,108 @@ class PrintDialog(QDialog):
             return
 
         page_num_to_render = self.preview_pages[self.current_preview_index]
+        landscape = self.orientation_combo.currentText() == "Landscape"
+
+        # Let MuPDF rasterize straight at the size the viewport will show
+        clip_rect = self._clip_rects[page_num_to_render]
+        page_w, page_h = clip_rect.width, clip_rect.height
+        if landscape:
+            page_w, page_h = page_h, page_w
+        available_size = self._preview_available_size()
+        dpi = min(available_size.width() / page_w, available_size.height() / page_h) * 72 * self.devicePixelRatioF()
+        key = (page_num_to_render, landscape, max(1, min(int(dpi), _PREVIEW_DPI_MAX)))
+
+        # Every request supersedes the ones still in flight, cache hits included
+        self._preview_job_id += 1
+        self._upgrade_timer.stop()
+        pixmap = self._preview_cache.get(key)
+        if pixmap is not None:
+            self._preview_cache.move_to_end(key)
+            self._show_preview(pixmap)
+        else:
+            # Show whatever we already have for this page (e.g. before a resize) or a fast pass,
+            # and schedule the full-resolution render
+            pixmap = self._closest_cached_preview(page_num_to_render, landscape)
+            if pixmap is not None:
+                self._show_preview(pixmap)
+            else:
+                fast_key = (page_num_to_render, landscape, max(1, int(key[2] * _PREVIEW_FAST_SCALE)))
+                self._start_preview_job(fast_key)
+            self._pending_upgrade = (self.current_preview_index, key)
+            self._upgrade_timer.start()
 
-        try:
-            page = self.doc.load_page(page_num_to_render)
-
-            # Always use "Fit to Page" logic for the preview
-            content_box = page.bound()
-            clip_rect = content_box if not content_box.is_empty else page.rect
-
-            pix = page.get_pixmap(clip=clip_rect, alpha=False)
-            q_image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(q_image)
-
-            # Apply orientation rotation if necessary
-            if self.orientation_combo.currentText() == "Landscape":
-                transform = QTransform().rotate(90)
-                pixmap = pixmap.transformed(transform, Qt.TransformationMode.SmoothTransformation)
+        self.page_info_label.setText(f"Page: {page_num_to_render + 1} of {self.total_pages}")
+        self.prev_page_button.setEnabled(self.current_preview_index > 0)
+        self.next_page_button.setEnabled(self.current_preview_index < len(self.preview_pages) - 1)
 
-            available_size = self.scroll_area.viewport().size()
-            available_size.setWidth(available_size.width() - 5)
-            available_size.setHeight(available_size.height() - 5)
+    def _start_preview_job(self, key):
+        job = _PreviewJob(self._preview_signals, self._preview_job_id, self._load_page, key,
+                          self._clip_rects[key[0]])
+        QThreadPool.globalInstance().start(job)
 
-            scaled_pixmap = pixmap.scaled(
-                available_size,
+    def _upgrade_preview(self):
+        index, key = self._pending_upgrade
+        if index != self.current_preview_index:
+            return
+        self._preview_job_id += 1
+        self._start_preview_job(key)
+
+    def _closest_cached_preview(self, page_num, landscape):
+        best_dpi, best = 0, None
+        for (cached_page, cached_landscape, dpi), pixmap in self._preview_cache.items():
+            if cached_page == page_num and cached_landscape == landscape and dpi > best_dpi:
+                best_dpi, best = dpi, pixmap
+        return best
+
+    def _on_preview_rendered(self, job_id, key, q_image):
+        pixmap = QPixmap.fromImage(q_image)
+        self._cache_preview(key, pixmap)
+        if job_id == self._preview_job_id:
+            self._show_preview(pixmap)
+
+    def _on_preview_failed(self, job_id, message):
+        if job_id == self._preview_job_id:
+            self.preview_label.setText(f"Error rendering page:\n{message}")
+
+    def _show_preview(self, pixmap):
+        ratio = self.devicePixelRatioF()
+        available_size = self._preview_available_size()
+        target_size = QSize(int(available_size.width() * ratio), int(available_size.height() * ratio))
+
+        # Pixmaps rendered for the current viewport are shown as-is; only stale sizes get rescaled
+        fitted_size = pixmap.size().scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio)
+        if abs(fitted_size.width() - pixmap.width()) > pixmap.width() * 0.02:
+            pixmap = pixmap.scaled(
+                target_size,
                 Qt.AspectRatioMode.KeepAspectRatio,
                 Qt.TransformationMode.SmoothTransformation
             )
-
-            self.preview_label.setPixmap(scaled_pixmap)
-
-        except Exception as e:
-            self.preview_label.setText(f"Error rendering page:\n{e}")
-
-        self.page_info_label.setText(f"Page: {page_num_to_render + 1} of {self.total_pages}")
-        self.prev_page_button.setEnabled(self.current_preview_index > 0)
-        self.next_page_button.setEnabled(self.current_preview_index < len(self.preview_pages) - 1)
+        else:
+            pixmap = QPixmap(pixmap)
+        pixmap.setDevicePixelRatio(ratio)
+
+        self.preview_label.setPixmap(pixmap)
+
+    def _preview_available_size(self):
+        available_size = self.scroll_area.viewport().size()
+        available_size.setWidth(max(1, available_size.width() - 5))
+        available_size.setHeight(max(1, available_size.height() - 5))
+        return available_size
+
+    def _cache_preview(self, key, pixmap):
+        previous = self._preview_cache.pop(key, None)
+        if previous is not None:
+            self._preview_cache_bytes -= previous.width() * previous.height() * 3
+        self._preview_cache[key] = pixmap
+        self._preview_cache_bytes += pixmap.width() * pixmap.height() * 3
+        while self._preview_cache and (len(self._preview_cache) > _PREVIEW_CACHE_MAX_ENTRIES
+                                       or self._preview_cache_bytes > _PREVIEW_CACHE_MAX_BYTES):
+            _, evicted = self._preview_cache.popitem(last=False)
+            self._preview_cache_bytes -= evicted.width() * evicted.height() * 3
+
+    def _clear_preview_cache(self):
+        self._preview_cache.clear()
+        self._preview_cache_bytes = 0
 
     def show_prev_page(self):
         if self.current_preview_index > 0:
@@ -395,19 +701,47 @@ class PrintDialog(QDialog):
             self.render_current_preview_page()
 
     def load_document(self):
-        try:
-            if self.file_path.lower().endswith('.pdf'):
-                self.doc = fitz.open(self.file_path)
-                self.total_pages = len(self.doc)
-            else:
-                raise ValueError("Unsupported file type")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load document: {e}")
-            self.close()
+        self.preview_label.setText("Loading document...")
+        self._loader = _LoaderThread(self.file_path, self)
+        self._loader.loaded.connect(self._on_document_loaded)
+        self._loader.failed.connect(self._on_document_failed)
+        self._loader.start()
+
+    def _on_document_loaded(self, doc, total_pages, clip_rects):
+        self._clear_preview_cache()
+        with _MUPDF_LOCK:
+            self._page_cache.clear()
+        self.doc = doc
+        self.total_pages = total_pages
+        self._clip_rects = clip_rects
+        self.all_pages_radio.setText(f"All Pages ({self.total_pages})")
+        self.print_button.setEnabled(True)
+        self.update_preview_range()
+
+    def _on_document_failed(self, message):
+        QMessageBox.critical(self, "Error", f"Failed to load document: {message}")
+        self.close()
+
+    def done(self, result):
+        # The loader is a child of this dialog; it must be stopped before the dialog can be destroyed
+        if self._loader is not None and self._loader.isRunning():
+            self._loader.loaded.disconnect()
+            self._loader.failed.disconnect()
+            self._loader.requestInterruption()
+            self._loader.wait()
+        super().done(result)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._loader is None:
+            self.load_document()
+            # Listing printers pulls in QtPrintSupport and queries the spooler; do it once the window is up
+            from PyQt6.QtPrintSupport import QPrinterInfo
+            self.printer_combo.addItems(QPrinterInfo.availablePrinterNames())
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.render_current_preview_page()
+        self._render_timer.start()
 
 
 if __name__ == '__main__':
@@ -1,15 +1,109 @@
 import sys
 import os
-import fitz  # PyMuPDF
+import re
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QApplication, QDialog, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox, QRadioButton, QLineEdit, QPushButton,
     QMessageBox, QScrollArea, QSpinBox
 )
-from PyQt6.QtGui import QPixmap, QPageSize, QPainter, QImage
-from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QPixmap, QPageSize, QPainter, QImage, QColor
+from PyQt6.QtCore import QRect, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtPrintSupport import QPrinter, QPrinterInfo
 
+# Previews are rendered at PREVIEW_WIDTH and kept in a small LRU so paging back and forth is a dict lookup.
+PREVIEW_WIDTH = 450
+PREVIEW_CACHE_SIZE = 16
+# How many print pages are rendered ahead of the painter.
+PRINT_PREFETCH_PAGES = 2
+
+# Page selections are comma-separated pages or ranges, e.g. "1,3-5,8".
+PAGE_LIST_RE = re.compile(r'^\s*\d+(?:\s*-\s*\d+)?(?:\s*,\s*\d+(?:\s*-\s*\d+)?)*\s*$')
+PAGE_RANGE_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+# MuPDF documents are not thread-safe; every page access from a worker goes through this lock.
+MUPDF_LOCK = threading.Lock()
+
+
+def uniform_pixel(pix):
+    """Returns the value shared by every pixel of an alpha-less pixmap as a tuple, or None if it has several.
+
+    Compares whole byte strings (memcmp) rather than walking samples in Python, which is what
+    Pixmap.is_unicolor does and takes seconds on a print-resolution page.
+    """
+    data = pix.samples_mv
+    n = pix.n
+    first = data[:n].tobytes()
+    # A sparse sample of first channels turns away nearly every real page before the full comparison
+    sample = data[::max(len(data) // (4096 * n), 1) * n].tobytes()
+    if sample != first[:1] * len(sample):
+        return None
+    # Without alpha MuPDF rows are unpadded (stride == width * n), so the buffer is pixels back to back
+    if data.tobytes() != first * (len(data) // n):
+        return None
+    return tuple(first)
+
+
+def parse_page_ranges(text, total_pages):
+    """Turns a selection like "1,3-5,8" into sorted, de-duplicated 0-based page numbers within the document."""
+    if not PAGE_LIST_RE.match(text):
+        return []
+    pages = set()
+    for match in PAGE_RANGE_RE.finditer(text):
+        start = int(match.group(1))
+        end = int(match.group(2) or start)
+        # Clamping each range up front keeps huge numbers from expanding into huge lists
+        pages.update(range(max(start - 1, 0), min(end, total_pages)))
+    return sorted(pages)
+
+
+class RenderSignals(QObject):
+    done = pyqtSignal(object, object)  # cache key, fitz.Pixmap
+    failed = pyqtSignal(object, str)
+
+
+class RenderJob(QRunnable):
+    """Rasterizes one preview page on the thread pool and hands the pixmap back to the GUI thread."""
+
+    def __init__(self, signals, doc, cache_key):
+        super().__init__()
+        self.signals = signals
+        self.doc = doc
+        self.cache_key = cache_key  # (page_num, width, grayscale)
+        # The pool deletes the C++ side once run() returns, so the GUI thread never calls into
+        # the job (e.g. QThreadPool.tryTake); it only flips these plain attributes.
+        self.state_lock = threading.Lock()
+        self.started = False
+        self.cancelled = False
+
+    def cancel(self):
+        """Stops the job from rendering if it has not started yet; returns True if it was stopped."""
+        with self.state_lock:
+            if not self.started:
+                self.cancelled = True
+            return self.cancelled
+
+    def run(self):
+        with self.state_lock:
+            if self.cancelled:
+                return
+            self.started = True
+        import fitz  # PyMuPDF
+        page_num, target_width, grayscale = self.cache_key
+        try:
+            with MUPDF_LOCK:
+                page = self.doc.load_page(page_num)
+                # Let MuPDF rasterize straight at the preview width instead of scaling afterwards
+                zoom = target_width / page.rect.width
+                colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace, alpha=False)
+        except Exception as e:
+            self.signals.failed.emit(self.cache_key, str(e))
+            return
+        self.signals.done.emit(self.cache_key, pix)
+
 
 class PrintDialog(QDialog):
     def __init__(self, file_path, parent=None):
@@ -17,8 +111,15 @@ class PrintDialog(QDialog):
         self.file_path = file_path
         self.doc = None
         self.total_pages = 0
-        self.preview_pages = []  # List of page numbers to show in preview
+        self.preview_pages = []  # Page numbers to show in preview (a range when all pages are selected)
         self.current_preview_index = 0
+        self.preview_cache = OrderedDict()  # (page_num, width, grayscale) -> scaled QPixmap
+        self.dpi_cache = {}  # printer name -> (DPI items, default DPI or None)
+        self.wanted_preview = None  # Cache key the label is waiting for; other results are only cached
+        self.pending_renders = {}  # cache key -> RenderJob queued or running
+        self.render_signals = RenderSignals()
+        self.render_signals.done.connect(self.on_preview_rendered)
+        self.render_signals.failed.connect(self.on_preview_failed)
 
         self.setWindowTitle("Advanced Print Dialog")
         self.setGeometry(150, 150, 550, 700)  # Slightly larger window
@@ -53,6 +154,7 @@ class PrintDialog(QDialog):
         # --- Color Mode ComboBox ---
         self.color_mode_combo = QComboBox()
         self.color_mode_combo.addItems(["Color", "Grayscale"])
+        self.color_mode_combo.currentTextChanged.connect(self.render_current_preview_page)
         right_panel.addWidget(QLabel("Color Mode:"))
         right_panel.addWidget(self.color_mode_combo)
 
@@ -73,7 +175,7 @@ class PrintDialog(QDialog):
         self.all_pages_radio.setChecked(True)
         self.range_radio = QRadioButton("Pages:")
         self.page_range_edit = QLineEdit()
-        self.page_range_edit.setPlaceholderText("e.g., 3 or 3-5")
+        self.page_range_edit.setPlaceholderText("e.g., 1,3-5,8")
         self.page_range_edit.setEnabled(False)
         self.range_radio.toggled.connect(self.page_range_edit.setEnabled)
 
@@ -121,46 +223,38 @@ class PrintDialog(QDialog):
     def update_dpi_list(self):
         """Populates the DPI combobox with resolutions supported by the selected printer."""
         printer_name = self.printer_combo.currentText()
-        printer_info = QPrinterInfo(QPrinterInfo.printerInfo(printer_name))
 
-        supported_resolutions = printer_info.supportedResolutions()
-        self.dpi_combo.clear()
+        # Driver queries can block on the print spooler, so each printer is only asked once
+        if printer_name not in self.dpi_cache:
+            supported_resolutions = QPrinterInfo.printerInfo(printer_name).supportedResolutions()
+            if supported_resolutions:
+                # Add resolutions as strings to the combobox
+                items = [str(dpi) for dpi in supported_resolutions]
+                # Set a sensible default if possible
+                if 300 in supported_resolutions:
+                    default = "300"
+                elif 600 in supported_resolutions:
+                    default = "600"
+                else:
+                    default = None
+            else:
+                # Fallback if the driver doesn't report resolutions
+                items, default = ["75", "96", "150", "300", "600"], "300"
+            self.dpi_cache[printer_name] = (items, default)
 
-        if supported_resolutions:
-            # Add resolutions as strings to the combobox
-            self.dpi_combo.addItems([str(dpi) for dpi in supported_resolutions])
-            # Set a sensible default if possible
-            if 300 in supported_resolutions:
-                self.dpi_combo.setCurrentText("300")
-            elif 600 in supported_resolutions:
-                self.dpi_combo.setCurrentText("600")
-        else:
-            # Fallback if the driver doesn't report resolutions
-            self.dpi_combo.addItems(["75", "96", "150", "300", "600"])
-            self.dpi_combo.setCurrentText("300")
+        items, default = self.dpi_cache[printer_name]
+        self.dpi_combo.clear()
+        self.dpi_combo.addItems(items)
+        if default is not None:
+            self.dpi_combo.setCurrentText(default)
 
     def update_preview_range(self):
         """Parses the page range selection and updates the preview navigation."""
-        self.preview_pages = []
-        try:
-            if self.all_pages_radio.isChecked() or not self.page_range_edit.text():
-                self.preview_pages = list(range(self.total_pages))
-            else:
-                range_text = self.page_range_edit.text().strip()
-                # Parse ranges like "3-5"
-                if '-' in range_text:
-                    start, end = map(int, range_text.split('-'))
-                    self.preview_pages = list(range(start - 1, end))
-                # Parse single pages like "3"
-                else:
-                    self.preview_pages = [int(range_text) - 1]
-
-            # Clamp values to be within the document's bounds
-            self.preview_pages = [p for p in self.preview_pages if 0 <= p < self.total_pages]
-
-        except ValueError:
-            # If text is invalid (e.g., "abc"), show nothing
-            self.preview_pages = []
+        if self.all_pages_radio.isChecked() or not self.page_range_edit.text():
+            self.preview_pages = range(self.total_pages)
+        else:
+            # Parse lists like "1,3-5,8"; invalid text (e.g., "abc") shows nothing
+            self.preview_pages = parse_page_ranges(self.page_range_edit.text(), self.total_pages)
 
         self.current_preview_index = 0
         self.render_current_preview_page()
@@ -176,20 +270,63 @@ class PrintDialog(QDialog):
 
         page_num_to_render = self.preview_pages[self.current_preview_index]
 
-        try:
-            page = self.doc.load_page(page_num_to_render)
-            pix = page.get_pixmap(alpha=False)
-            q_image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(q_image)
-            self.preview_label.setPixmap(pixmap.scaledToWidth(450, Qt.TransformationMode.SmoothTransformation))
-        except Exception as e:
-            self.preview_label.setText(f"Error rendering page:\n{e}")
+        # The preview width is fixed, so caching the rendered result covers repeat visits
+        grayscale = self.color_mode_combo.currentText() == "Grayscale"
+        cache_key = (page_num_to_render, PREVIEW_WIDTH, grayscale)
+        self.wanted_preview = cache_key
+        pixmap = self.preview_cache.get(cache_key)
+        if pixmap is not None:
+            self.preview_cache.move_to_end(cache_key)
+            self.preview_label.setPixmap(pixmap)
+        else:
+            self.preview_label.setText("Rendering page...")
+            self.request_render(cache_key)
+
+        self.prefetch_neighbours(grayscale)
 
         # Update navigation UI
         self.page_info_label.setText(f"Page: {page_num_to_render + 1} of {self.total_pages}")
         self.prev_page_button.setEnabled(self.current_preview_index > 0)
         self.next_page_button.setEnabled(self.current_preview_index < len(self.preview_pages) - 1)
 
+    def request_render(self, cache_key):
+        """Queues a background render of `cache_key` unless one is already pending."""
+        if cache_key not in self.pending_renders:
+            job = RenderJob(self.render_signals, self.doc, cache_key)
+            self.pending_renders[cache_key] = job
+            QThreadPool.globalInstance().start(job)
+
+    def prefetch_neighbours(self, grayscale):
+        """Renders the next and previous pages in the background so stepping to them is a cache hit."""
+        neighbours = [(self.preview_pages[index], PREVIEW_WIDTH, grayscale)
+                      for index in (self.current_preview_index + 1, self.current_preview_index - 1)
+                      if 0 <= index < len(self.preview_pages)]
+        # Prefetches that have not started yet and are no longer adjacent are cancelled
+        for key, job in list(self.pending_renders.items()):
+            if key != self.wanted_preview and key not in neighbours and job.cancel():
+                del self.pending_renders[key]
+        for key in neighbours:
+            if key not in self.preview_cache:
+                self.request_render(key)
+
+    def on_preview_rendered(self, cache_key, pix):
+        """Caches a finished render and shows it if the user is on that page."""
+        self.pending_renders.pop(cache_key, None)
+        # samples_mv aliases the MuPDF buffer (pix stays referenced here), so QPixmap.fromImage is the only copy
+        fmt = QImage.Format.Format_Grayscale8 if pix.n == 1 else QImage.Format.Format_RGB888
+        q_image = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, fmt)
+        pixmap = QPixmap.fromImage(q_image)
+        self.preview_cache[cache_key] = pixmap
+        if len(self.preview_cache) > PREVIEW_CACHE_SIZE:
+            self.preview_cache.popitem(last=False)
+        if cache_key == self.wanted_preview:
+            self.preview_label.setPixmap(pixmap)
+
+    def on_preview_failed(self, cache_key, message):
+        self.pending_renders.pop(cache_key, None)
+        if cache_key == self.wanted_preview:
+            self.preview_label.setText(f"Error rendering page:\n{message}")
+
     def show_prev_page(self):
         """Navigates to the previous page in the preview range."""
         if self.current_preview_index > 0:
@@ -202,10 +339,32 @@ class PrintDialog(QDialog):
             self.current_preview_index += 1
             self.render_current_preview_page()
 
+    def done(self, result):
+        """Releases the document and MuPDF's cached resources however the dialog is dismissed."""
+        # Results still in flight must not touch the closing dialog; queued ones need not run at all
+        self.wanted_preview = None
+        for job in self.pending_renders.values():
+            job.cancel()
+        self.pending_renders.clear()
+        if self.doc is not None:
+            import fitz  # PyMuPDF
+            with MUPDF_LOCK:
+                self.doc.close()
+                self.doc = None
+                fitz.TOOLS.store_shrink(100)
+        super().done(result)
+
     def load_document(self):
+        if self.doc is not None:
+            # Already open; keep the handle and the previews rendered from it
+            return
+        self.preview_cache.clear()
         try:
             if self.file_path.lower().endswith('.pdf'):
-                self.doc = fitz.open(self.file_path)
+                # MuPDF is only loaded once there is a PDF to open
+                import fitz  # PyMuPDF
+                # Name the type so MuPDF skips content sniffing
+                self.doc = fitz.open(self.file_path, filetype="pdf")
                 self.total_pages = len(self.doc)
             else:
                 raise ValueError("Unsupported file type")
@@ -252,36 +411,57 @@ class PrintDialog(QDialog):
             QMessageBox.critical(self, "Print Error", "Could not start the printer.")
             return
 
-        # Use the selected DPI for rendering the page pixmap
-        print_dpi = printer.resolution()
-
-        try:
-            for i, page_num in enumerate(pages_to_print):
-                page = self.doc.load_page(page_num)
-
-                if self.color_mode_combo.currentText() == "Grayscale":
-                    pix = page.get_pixmap(dpi=print_dpi, colorspace=fitz.csGRAY, alpha=False)
-                    q_image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_Grayscale8)
-                else:
-                    pix = page.get_pixmap(dpi=print_dpi, colorspace=fitz.csRGB, alpha=False)
-                    q_image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-
-                if q_image.isNull():
-                    print(f"Warning: Could not create a valid image for page {page_num + 1}.")
-                    continue
+        # pageRect is in device pixels at the selected DPI; pages are rendered to fit it exactly
+        page_rect = printer.pageRect(QPrinter.Unit.DevicePixel)
+        target_w, target_h = page_rect.width(), page_rect.height()
 
-                page_rect = printer.pageRect(QPrinter.Unit.DevicePixel)
-                target_size = page_rect.size().toSize()
-                scaled_size = q_image.size().scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio)
-
-                x = (page_rect.width() - scaled_size.width()) / 2
-                y = (page_rect.height() - scaled_size.height()) / 2
+        # The color mode decides the MuPDF colorspace and the matching QImage format once per job
+        import fitz  # PyMuPDF
+        if self.color_mode_combo.currentText() == "Grayscale":
+            colorspace, fmt = fitz.csGRAY, QImage.Format.Format_Grayscale8
+        else:
+            colorspace, fmt = fitz.csRGB, QImage.Format.Format_RGB888
 
-                target_rect = QRect(int(x), int(y), scaled_size.width(), scaled_size.height())
-                painter.drawImage(target_rect, q_image)
+        # A single worker keeps a sliding window of renders in flight, so page N+1 decodes
+        # while page N is being drawn and at most PRINT_PREFETCH_PAGES bitmaps are pending
+        executor = ThreadPoolExecutor(max_workers=1)
+        window = deque(executor.submit(self.render_print_page, page_num, target_w, target_h, colorspace)
+                       for page_num in pages_to_print[:PRINT_PREFETCH_PAGES])
 
-                if i < len(pages_to_print) - 1:
+        pages_drawn = 0
+        try:
+            for i, page_num in enumerate(pages_to_print):
+                pix, fill = window.popleft().result()
+                ahead = i + PRINT_PREFETCH_PAGES
+                if ahead < len(pages_to_print):
+                    window.append(executor.submit(
+                        self.render_print_page, pages_to_print[ahead], target_w, target_h, colorspace))
+
+                q_image = None
+                if fill is None:
+                    # samples_mv aliases the MuPDF buffer without a bytes copy; pix is only released along with q_image
+                    q_image = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, fmt)
+
+                    if q_image.isNull():
+                        print(f"Warning: Could not create a valid image for page {page_num + 1}.")
+                        continue
+
+                # Already rasterized at its final size, so draw 1:1 and only center it
+                x = (target_w - pix.width) / 2
+                y = (target_h - pix.height) / 2
+
+                target_rect = QRect(int(x), int(y), pix.width, pix.height)
+                # Start a new sheet only ahead of the next drawn page, so skipped pages never leave blanks
+                if pages_drawn:
                     printer.newPage()
+                if fill is not None:
+                    # A blank or solid page prints the same as a filled rect, without spooling the bitmap
+                    painter.fillRect(target_rect, QColor(*fill))
+                else:
+                    painter.drawImage(target_rect, q_image)
+                pages_drawn += 1
+                # Drop this page's bitmap now rather than holding it while waiting on the next one
+                pix = q_image = None
 
             painter.end()
             QMessageBox.information(self, "Success", "Document sent to printer.")
@@ -291,6 +471,29 @@ class PrintDialog(QDialog):
             QMessageBox.critical(self, "Printing Failed", f"An unexpected error occurred: {e}")
             if painter.isActive():
                 painter.end()
+        finally:
+            for future in window:
+                future.cancel()
+            executor.shutdown(wait=True)
+            # Print-resolution decodes are of no use to the preview; hand them back to the OS
+            with MUPDF_LOCK:
+                fitz.TOOLS.store_shrink(100)
+
+    def render_print_page(self, page_num, target_w, target_h, colorspace):
+        """Rasterizes one page to fit target_w x target_h device pixels; runs on process_and_print's worker thread.
+
+        Returns (pix, fill) where fill is the page's RGB color if every pixel is the same, else None.
+        """
+        import fitz  # PyMuPDF
+        with MUPDF_LOCK:
+            page = self.doc.load_page(page_num)
+            zoom = min(target_w / page.rect.width, target_h / page.rect.height)
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace, alpha=False)
+        # Uniform pages are reported as an RGB fill color so the painter can skip the bitmap
+        pixel = uniform_pixel(pix)
+        if pixel is not None:
+            return pix, (pixel * 3 if pix.n == 1 else pixel)
+        return pix, None
 
 
 if __name__ == '__main__':
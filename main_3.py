@@ -1,14 +1,250 @@
 import sys
 import os
-import fitz  # PyMuPDF
-from PyQt6.QtPrintSupport import QPrinter
+import re
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtPrintSupport import QPrinter, QPrinterInfo
 from PyQt6.QtWidgets import (
     QApplication, QDialog, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox, QRadioButton, QLineEdit, QPushButton,
-    QMessageBox, QScrollArea, QSpinBox, QWidget, QGroupBox
+    QMessageBox, QScrollArea, QSpinBox, QWidget, QGroupBox, QProgressBar
 )
-from PyQt6.QtGui import QPixmap, QPageSize, QPainter, QImage
-from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QPixmap, QPageSize, QPainter, QImage, QColor
+from PyQt6.QtCore import Qt, QRect, QTimer, QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+
+# Previews are rendered by MuPDF straight at the viewport size and kept in a small LRU
+# keyed by (page, width, height), so paging back and forth or repainting at an
+# unchanged size never goes back to MuPDF.
+PREVIEW_CACHE_SIZE = 16
+# A window drag fires many resize events; only re-render once it pauses this long.
+RESIZE_DEBOUNCE_MS = 50
+# While navigating, an earlier render of the page is stretched with FastTransformation;
+# the exact render is only requested once the user has been idle this long.
+REFINE_DELAY_MS = 120
+# How many print pages are rendered ahead of the painter.
+PRINT_PREFETCH_PAGES = 2
+
+# Page selections are comma-separated pages or ranges, e.g. "1,3-5,8".
+PAGE_LIST_RE = re.compile(r'^\s*\d+(?:\s*-\s*\d+)?(?:\s*,\s*\d+(?:\s*-\s*\d+)?)*\s*$')
+PAGE_RANGE_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+# MuPDF documents are not thread-safe; every page access from a worker goes through this lock.
+MUPDF_LOCK = threading.Lock()
+
+
+def uniform_pixel(pix):
+    """Returns the value shared by every pixel of an alpha-less pixmap as a tuple, or None if it has several.
+
+    Compares whole byte strings (memcmp) rather than walking samples in Python, which is what
+    Pixmap.is_unicolor does and takes seconds on a print-resolution page.
+    """
+    data = pix.samples_mv
+    n = pix.n
+    first = data[:n].tobytes()
+    # A sparse sample of first channels turns away nearly every real page before the full comparison
+    sample = data[::max(len(data) // (4096 * n), 1) * n].tobytes()
+    if sample != first[:1] * len(sample):
+        return None
+    # Without alpha MuPDF rows are unpadded (stride == width * n), so the buffer is pixels back to back
+    if data.tobytes() != first * (len(data) // n):
+        return None
+    return tuple(first)
+
+
+def parse_page_ranges(text, total_pages):
+    """Turns a selection like "1,3-5,8" into sorted, de-duplicated 0-based page numbers within the document."""
+    if not PAGE_LIST_RE.match(text):
+        return []
+    pages = set()
+    for match in PAGE_RANGE_RE.finditer(text):
+        start = int(match.group(1))
+        end = int(match.group(2) or start)
+        # Clamping each range up front keeps huge numbers from expanding into huge lists
+        pages.update(range(max(start - 1, 0), min(end, total_pages)))
+    return sorted(pages)
+
+
+class RenderSignals(QObject):
+    done = pyqtSignal(object, object)  # cache key, fitz.Pixmap
+    failed = pyqtSignal(object, str)
+
+
+class RenderJob(QRunnable):
+    """Rasterizes one preview page on the thread pool and hands the pixmap back to the GUI thread."""
+
+    def __init__(self, signals, doc, cache_key):
+        super().__init__()
+        self.signals = signals
+        self.doc = doc
+        self.cache_key = cache_key  # (page_num, width, height, grayscale)
+        # The pool deletes the C++ side once run() returns, so the GUI thread never calls into
+        # the job (e.g. QThreadPool.tryTake); it only flips these plain attributes.
+        self.state_lock = threading.Lock()
+        self.started = False
+        self.cancelled = False
+
+    def cancel(self):
+        """Stops the job from rendering if it has not started yet; returns True if it was stopped."""
+        with self.state_lock:
+            if not self.started:
+                self.cancelled = True
+            return self.cancelled
+
+    def run(self):
+        with self.state_lock:
+            if self.cancelled:
+                return
+            self.started = True
+        import fitz  # PyMuPDF
+        page_num, target_w, target_h, grayscale = self.cache_key
+        try:
+            with MUPDF_LOCK:
+                page = self.doc.load_page(page_num)
+                # Render at the zoom that fits the page into the viewport, so no Qt rescale is needed
+                zoom = max(min(target_w / page.rect.width, target_h / page.rect.height), 0.01)
+                colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace, alpha=False)
+        except Exception as e:
+            self.signals.failed.emit(self.cache_key, str(e))
+            return
+        self.signals.done.emit(self.cache_key, pix)
+
+
+class PrintWorker(QObject):
+    """Runs a whole print job on its own QThread.
+
+    The QPrinter and QPainter are created and used only on that thread; the dialog follows
+    along through `progress`, `failed` and `finished`.
+    """
+    progress = pyqtSignal(int, int)  # pages processed, total pages
+    failed = pyqtSignal(str, str)  # title, message
+    finished = pyqtSignal()
+
+    def __init__(self, doc, pages_to_print, printer_name, copies, page_size_id, dpi, grayscale):
+        super().__init__()
+        self.doc = doc
+        self.pages_to_print = pages_to_print
+        self.printer_name = printer_name
+        self.copies = copies
+        self.page_size_id = page_size_id
+        self.dpi = dpi
+        self.grayscale = grayscale
+        self.completed = False
+        # Set straight from the GUI thread; a queued slot would not run while run() is busy
+        self.cancelled = threading.Event()
+
+    def run(self):
+        try:
+            self.print_pages()
+        except Exception as e:
+            self.failed.emit("Printing Failed", f"An unexpected error occurred: {e}")
+        finally:
+            self.finished.emit()
+
+    def print_pages(self):
+        import fitz  # PyMuPDF
+        printer = QPrinter()
+        printer.setPrinterName(self.printer_name)
+        printer.setCopyCount(self.copies)
+        printer.setPageSize(QPageSize(self.page_size_id))
+        if self.dpi is not None:
+            printer.setResolution(self.dpi)
+
+        # The color mode decides the MuPDF colorspace and the matching QImage format once per job
+        if self.grayscale:
+            printer.setColorMode(QPrinter.ColorMode.GrayScale)
+            colorspace, fmt = fitz.csGRAY, QImage.Format.Format_Grayscale8
+        else:
+            printer.setColorMode(QPrinter.ColorMode.Color)
+            colorspace, fmt = fitz.csRGB, QImage.Format.Format_RGB888
+
+        painter = QPainter()
+        if not painter.begin(printer):
+            self.failed.emit("Print Error", "Could not start the printer. Check connection and drivers.")
+            return
+
+        # pageRect is in device pixels at the selected DPI; pages are rendered to fit it exactly
+        page_rect = printer.pageRect(QPrinter.Unit.DevicePixel)
+        target_w, target_h = page_rect.width(), page_rect.height()
+        pages_to_print = self.pages_to_print
+
+        # A single worker keeps a sliding window of renders in flight, so page N+1 decodes
+        # while page N is being drawn and at most PRINT_PREFETCH_PAGES bitmaps are pending
+        executor = ThreadPoolExecutor(max_workers=1)
+        window = deque(executor.submit(self.render_print_page, page_num, target_w, target_h, colorspace)
+                       for page_num in pages_to_print[:PRINT_PREFETCH_PAGES])
+
+        pages_drawn = 0
+        try:
+            for i, page_num in enumerate(pages_to_print):
+                self.progress.emit(i, len(pages_to_print))
+                if self.cancelled.is_set():
+                    # Drop the partly spooled job rather than printing a truncated document
+                    printer.abort()
+                    return
+
+                pix, fill = window.popleft().result()
+                ahead = i + PRINT_PREFETCH_PAGES
+                if ahead < len(pages_to_print):
+                    window.append(executor.submit(
+                        self.render_print_page, pages_to_print[ahead], target_w, target_h, colorspace))
+
+                q_image = None
+                if fill is None:
+                    # samples_mv aliases the MuPDF buffer without a bytes copy; pix is only released along with q_image
+                    q_image = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, fmt)
+
+                    if q_image.isNull():
+                        print(f"Warning: Could not create a valid image for page {page_num + 1}.")
+                        continue
+
+                # Already rasterized at its final size, so draw 1:1 and only center it
+                x = (target_w - pix.width) / 2
+                y = (target_h - pix.height) / 2
+
+                target_rect = QRect(int(x), int(y), pix.width, pix.height)
+                # Start a new sheet only ahead of the next drawn page, so skipped pages never leave blanks
+                if pages_drawn:
+                    printer.newPage()
+                if fill is not None:
+                    # A blank or solid page prints the same as a filled rect, without spooling the bitmap
+                    painter.fillRect(target_rect, QColor(*fill))
+                else:
+                    painter.drawImage(target_rect, q_image)
+                pages_drawn += 1
+                # Drop this page's bitmap now rather than holding it while waiting on the next one
+                pix = q_image = None
+
+            painter.end()
+            self.progress.emit(len(pages_to_print), len(pages_to_print))
+            self.completed = True
+
+        finally:
+            if painter.isActive():
+                painter.end()
+            for future in window:
+                future.cancel()
+            executor.shutdown(wait=True)
+            # Print-resolution decodes are of no use to the preview; hand them back to the OS
+            with MUPDF_LOCK:
+                fitz.TOOLS.store_shrink(100)
+
+    def render_print_page(self, page_num, target_w, target_h, colorspace):
+        """Rasterizes one page to fit target_w x target_h device pixels; runs on print_pages' render thread.
+
+        Returns (pix, fill) where fill is the page's RGB color if every pixel is the same, else None.
+        """
+        import fitz  # PyMuPDF
+        with MUPDF_LOCK:
+            page = self.doc.load_page(page_num)
+            zoom = min(target_w / page.rect.width, target_h / page.rect.height)
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace, alpha=False)
+        # Uniform pages are reported as an RGB fill color so the painter can skip the bitmap
+        pixel = uniform_pixel(pix)
+        if pixel is not None:
+            return pix, (pixel * 3 if pix.n == 1 else pixel)
+        return pix, None
 
 
 class PrintDialog(QDialog):
@@ -23,6 +259,16 @@ class PrintDialog(QDialog):
         self.total_pages = 0
         self.preview_pages = []
         self.current_preview_index = 0
+        self.preview_cache = OrderedDict()  # (page_num, width, height, grayscale) -> QPixmap
+        self.dpi_cache = {}  # printer name -> (DPI items, default DPI or None)
+        self.displayed_page = None  # Page currently shown in preview_label, if any
+        self.wanted_preview = None  # Cache key the label is waiting for; other results are only cached
+        self.pending_renders = {}  # cache key -> RenderJob queued or running
+        self.print_error = None  # (title, message) reported by the last PrintWorker, if it failed
+        self.print_running = False  # True from PrintWorker start until its finished signal arrives
+        self.render_signals = RenderSignals()
+        self.render_signals.done.connect(self.on_preview_rendered)
+        self.render_signals.failed.connect(self.on_preview_failed)
 
         self.setWindowTitle("Professional Print Utility")
         self.setGeometry(150, 150, 900, 700)
@@ -62,6 +308,7 @@ class PrintDialog(QDialog):
 
         self.color_mode_combo = QComboBox()
         self.color_mode_combo.addItems(["Color", "Grayscale"])
+        self.color_mode_combo.currentTextChanged.connect(self.render_current_preview_page)
         controls_layout.addWidget(QLabel("Color Mode:"))
         controls_layout.addWidget(self.color_mode_combo)
 
@@ -82,7 +329,7 @@ class PrintDialog(QDialog):
         self.all_pages_radio.setChecked(True)  # Fixed typo here
         self.range_radio = QRadioButton("Custom Range:")
         self.page_range_edit = QLineEdit()
-        self.page_range_edit.setPlaceholderText("e.g., 3 or 3-5")
+        self.page_range_edit.setPlaceholderText("e.g., 1,3-5,8")
         self.page_range_edit.setEnabled(False)
         self.range_radio.toggled.connect(self.page_range_edit.setEnabled)
         self.all_pages_radio.toggled.connect(self.update_preview_range)
@@ -134,128 +381,122 @@ class PrintDialog(QDialog):
         main_layout.addLayout(top_bar_layout)
         main_layout.addLayout(content_layout)
 
-        from PyQt6.QtPrintSupport import QPrinterInfo
-        self.printer_combo.addItems(QPrinterInfo.availablePrinterNames())
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self.render_current_preview_page)
 
-    def execute_print(self):
-        loading_dialog = QDialog(self)
-        loading_dialog.setModal(True)
-        loading_dialog.setWindowTitle("Processing...")
-        loading_dialog.setLayout(QVBoxLayout())
-        loading_dialog.layout().addWidget(QLabel("Sending document to printer, please wait..."))
-        loading_dialog.setFixedSize(300, 100)
-        loading_dialog.show()
-        QApplication.processEvents()
+        self._refine_timer = QTimer(self)
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.setInterval(REFINE_DELAY_MS)
+        self._refine_timer.timeout.connect(self.refine_preview)
 
-        try:
-            from PyQt6.QtPrintSupport import QPrinter
-            printer = QPrinter()
-            printer.setPrinterName(self.printer_combo.currentText())
-            printer.setCopyCount(self.copies_spinbox.value())
-
-            paper_size_str = self.paper_size_combo.currentText()
-            paper_sizes = {
-                "Letter": QPageSize.PageSizeId.Letter, "A4": QPageSize.PageSizeId.A4,
-                "Legal": QPageSize.PageSizeId.Legal, "A3": QPageSize.PageSizeId.A3, "A5": QPageSize.PageSizeId.A5
-            }
-            printer.setPageSize(QPageSize(paper_sizes.get(paper_size_str, QPageSize.PageSizeId.Letter)))
-
-            try:
-                printer.setResolution(int(self.dpi_combo.currentText()))
-            except (ValueError, TypeError):
-                pass
-
-            if self.color_mode_combo.currentText() == "Grayscale":
-                printer.setColorMode(QPrinter.ColorMode.GrayScale)
-            else:
-                printer.setColorMode(QPrinter.ColorMode.Color)
-
-            self.process_and_print(printer)
-
-        finally:
-            loading_dialog.close()
+        self.printer_combo.addItems(QPrinterInfo.availablePrinterNames())
 
-    def process_and_print(self, printer):
+    def execute_print(self):
         pages_to_print = self.preview_pages
         if not pages_to_print:
             QMessageBox.warning(self, "No Pages Selected", "There are no valid pages selected to print.")
             return
 
-        painter = QPainter()
-        if not painter.begin(printer):
-            QMessageBox.critical(self, "Print Error", "Could not start the printer. Check connection and drivers.")
-            return
-
-        print_dpi = printer.resolution()
-
+        paper_size_str = self.paper_size_combo.currentText()
+        paper_sizes = {
+            "Letter": QPageSize.PageSizeId.Letter, "A4": QPageSize.PageSizeId.A4,
+            "Legal": QPageSize.PageSizeId.Legal, "A3": QPageSize.PageSizeId.A3, "A5": QPageSize.PageSizeId.A5
+        }
         try:
-            for i, page_num in enumerate(pages_to_print):
-                page = self.doc.load_page(page_num)
-
-                if self.color_mode_combo.currentText() == "Grayscale":
-                    pix = page.get_pixmap(dpi=print_dpi, colorspace=fitz.csGRAY, alpha=False)
-                    q_image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_Grayscale8)
-                else:
-                    pix = page.get_pixmap(dpi=print_dpi, colorspace=fitz.csRGB, alpha=False)
-                    q_image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-
-                if q_image.isNull():
-                    print(f"Warning: Could not create a valid image for page {page_num + 1}.")
-                    continue
+            dpi = int(self.dpi_combo.currentText())
+        except (ValueError, TypeError):
+            dpi = None
 
-                page_rect = printer.pageRect(QPrinter.Unit.DevicePixel)
-                target_size = page_rect.size().toSize()
-                scaled_size = q_image.size().scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio)
+        # Widgets are read here; the worker only ever sees plain values
+        worker = PrintWorker(
+            self.doc, pages_to_print, self.printer_combo.currentText(), self.copies_spinbox.value(),
+            paper_sizes.get(paper_size_str, QPageSize.PageSizeId.Letter), dpi,
+            self.color_mode_combo.currentText() == "Grayscale")
 
-                x = (page_rect.width() - scaled_size.width()) / 2
-                y = (page_rect.height() - scaled_size.height()) / 2
-
-                target_rect = QRect(int(x), int(y), scaled_size.width(), scaled_size.height())
-                painter.drawImage(target_rect, q_image)
-
-                if i < len(pages_to_print) - 1:
-                    printer.newPage()
-
-            painter.end()
+        loading_dialog = QDialog(self)
+        loading_dialog.setModal(True)
+        loading_dialog.setWindowTitle("Processing...")
+        loading_dialog.setLayout(QVBoxLayout())
+        status_label = QLabel("Sending document to printer, please wait...")
+        loading_dialog.layout().addWidget(status_label)
+        progress_bar = QProgressBar()
+        progress_bar.setRange(0, len(pages_to_print))
+        loading_dialog.layout().addWidget(progress_bar)
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(loading_dialog.reject)
+        loading_dialog.layout().addWidget(cancel_button)
+        loading_dialog.setFixedSize(300, 140)
+
+        self.print_error = None
+        # No parent: the thread and worker are freed with these locals once wait() has returned
+        thread = QThread()
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(progress_bar.setValue)
+        worker.failed.connect(self.on_print_failed)
+        worker.finished.connect(self.on_print_finished)
+        worker.finished.connect(loading_dialog.accept)
+
+        def cancel_print():
+            # Cancel, Esc and the close button all reject; the worker stops before its next page
+            worker.cancelled.set()
+            status_label.setText("Cancelling, finishing the current page...")
+            cancel_button.setEnabled(False)
+
+        loading_dialog.rejected.connect(cancel_print)
+
+        self.print_running = True
+        thread.start()
+        # A rejected dialog closes at once; reopen it in its cancelling state until the worker is done,
+        # so the GUI keeps running its event loop instead of blocking in wait()
+        while self.print_running:
+            loading_dialog.exec()
+        # finished is the worker's last act, so this only waits for run() to return
+        thread.quit()
+        thread.wait()
+
+        if self.print_error is not None:
+            QMessageBox.critical(self, *self.print_error)
+        elif worker.completed:
             QMessageBox.information(self, "Success", "Document has been sent to the printer.")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Printing Failed", f"An unexpected error occurred: {e}")
-            if painter.isActive():
-                painter.end()
+    def on_print_failed(self, title, message):
+        self.print_error = (title, message)
+
+    def on_print_finished(self):
+        self.print_running = False
 
     def update_dpi_list(self):
-        from PyQt6.QtPrintSupport import QPrinterInfo
         printer_name = self.printer_combo.currentText()
         if not printer_name: return
-        printer_info = QPrinterInfo(QPrinterInfo.printerInfo(printer_name))
-        supported_resolutions = printer_info.supportedResolutions()
+        # Driver queries can block on the print spooler, so each printer is only asked once
+        if printer_name not in self.dpi_cache:
+            supported_resolutions = QPrinterInfo.printerInfo(printer_name).supportedResolutions()
+            if supported_resolutions:
+                items = [str(dpi) for dpi in supported_resolutions]
+                if 300 in supported_resolutions:
+                    default = "300"
+                elif 600 in supported_resolutions:
+                    default = "600"
+                else:
+                    default = None
+            else:
+                items, default = ["75", "96", "150", "300", "600"], "300"
+            self.dpi_cache[printer_name] = (items, default)
+
+        items, default = self.dpi_cache[printer_name]
         self.dpi_combo.clear()
-        if supported_resolutions:
-            self.dpi_combo.addItems([str(dpi) for dpi in supported_resolutions])
-            if 300 in supported_resolutions:
-                self.dpi_combo.setCurrentText("300")
-            elif 600 in supported_resolutions:
-                self.dpi_combo.setCurrentText("600")
-        else:
-            self.dpi_combo.addItems(["75", "96", "150", "300", "600"])
-            self.dpi_combo.setCurrentText("300")
+        self.dpi_combo.addItems(items)
+        if default is not None:
+            self.dpi_combo.setCurrentText(default)
 
     def update_preview_range(self):
-        self.preview_pages = []
-        try:
-            if self.all_pages_radio.isChecked() or not self.page_range_edit.text():
-                self.preview_pages = list(range(self.total_pages))
-            else:
-                range_text = self.page_range_edit.text().strip()
-                if '-' in range_text:
-                    start, end = map(int, range_text.split('-'))
-                    self.preview_pages = list(range(start - 1, end))
-                else:
-                    self.preview_pages = [int(range_text) - 1]
-            self.preview_pages = [p for p in self.preview_pages if 0 <= p < self.total_pages]
-        except ValueError:
-            self.preview_pages = []
+        if self.all_pages_radio.isChecked() or not self.page_range_edit.text():
+            self.preview_pages = range(self.total_pages)
+        else:
+            self.preview_pages = parse_page_ranges(self.page_range_edit.text(), self.total_pages)
         self.current_preview_index = 0
         self.render_current_preview_page()
 
@@ -269,31 +510,102 @@ class PrintDialog(QDialog):
 
         page_num_to_render = self.preview_pages[self.current_preview_index]
 
-        try:
-            page = self.doc.load_page(page_num_to_render)
-            pix = page.get_pixmap(alpha=False)
-            q_image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(q_image)
-
-            available_size = self.scroll_area.viewport().size()
-            available_size.setWidth(available_size.width() - 5)
-            available_size.setHeight(available_size.height() - 5)
-
-            scaled_pixmap = pixmap.scaled(
-                available_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        cache_key = self.preview_cache_key(page_num_to_render)
+        self.wanted_preview = cache_key
+        pixmap = self.preview_cache.get(cache_key)
+        if pixmap is not None:
+            self.preview_cache.move_to_end(cache_key)
+            self.show_preview(page_num_to_render, pixmap)
+        else:
+            stale = self.latest_cached_preview(cache_key)
+            if stale is not None:
+                # Cheap stretch of an earlier render now; the exact render follows once navigation settles
+                self.show_preview(page_num_to_render, stale.scaled(
+                    cache_key[1], cache_key[2], Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.FastTransformation))
+                self._refine_timer.start()
+            else:
+                # On a resize keep the current picture up until the new one lands
+                if page_num_to_render != self.displayed_page:
+                    self.displayed_page = None
+                    self.preview_label.setText("Rendering page...")
+                self.request_render(cache_key)
 
-            self.preview_label.setPixmap(scaled_pixmap)
-
-        except Exception as e:
-            self.preview_label.setText(f"Error rendering page:\n{e}")
+        self.prefetch_neighbours()
 
         self.page_info_label.setText(f"Page: {page_num_to_render + 1} of {self.total_pages}")
         self.prev_page_button.setEnabled(self.current_preview_index > 0)
         self.next_page_button.setEnabled(self.current_preview_index < len(self.preview_pages) - 1)
 
+    def preview_cache_key(self, page_num):
+        """Identifies a preview render: the page, the viewport it must fit and the color mode."""
+        available_size = self.scroll_area.viewport().size()
+        grayscale = self.color_mode_combo.currentText() == "Grayscale"
+        return page_num, available_size.width() - 5, available_size.height() - 5, grayscale
+
+    def request_render(self, cache_key):
+        """Queues a background render of `cache_key` unless one is already pending."""
+        if cache_key not in self.pending_renders:
+            job = RenderJob(self.render_signals, self.doc, cache_key)
+            self.pending_renders[cache_key] = job
+            QThreadPool.globalInstance().start(job)
+
+    def prefetch_neighbours(self):
+        """Renders the next and previous pages in the background so stepping to them is a cache hit."""
+        neighbours = [self.preview_cache_key(self.preview_pages[index])
+                      for index in (self.current_preview_index + 1, self.current_preview_index - 1)
+                      if 0 <= index < len(self.preview_pages)]
+        # Prefetches that have not started yet and are no longer adjacent are cancelled
+        for key, job in list(self.pending_renders.items()):
+            if key != self.wanted_preview and key not in neighbours and job.cancel():
+                del self.pending_renders[key]
+        for key in neighbours:
+            if key not in self.preview_cache:
+                self.request_render(key)
+
+    def refine_preview(self):
+        """Replaces a stretched preview with an exact render if the user is still on that page and size."""
+        if not self.preview_pages:
+            return
+        cache_key = self.preview_cache_key(self.preview_pages[self.current_preview_index])
+        if cache_key not in self.preview_cache:
+            self.request_render(cache_key)
+
+    def latest_cached_preview(self, cache_key):
+        """Returns the most recently used render of the same page and color mode at any size, or None."""
+        page_num, grayscale = cache_key[0], cache_key[3]
+        for key in reversed(self.preview_cache):
+            if key[0] == page_num and key[3] == grayscale:
+                return self.preview_cache[key]
+        return None
+
+    def on_preview_rendered(self, cache_key, pix):
+        """Caches a finished render and shows it if it is the one the user is waiting for."""
+        self.pending_renders.pop(cache_key, None)
+        # samples_mv aliases the MuPDF buffer (pix stays referenced here), so QPixmap.fromImage is the only copy
+        fmt = QImage.Format.Format_Grayscale8 if pix.n == 1 else QImage.Format.Format_RGB888
+        q_image = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, fmt)
+        pixmap = QPixmap.fromImage(q_image)
+        self.cache_put(self.preview_cache, cache_key, pixmap)
+        if cache_key == self.wanted_preview:
+            self.show_preview(cache_key[0], pixmap)
+
+    def on_preview_failed(self, cache_key, message):
+        self.pending_renders.pop(cache_key, None)
+        if cache_key == self.wanted_preview:
+            self.displayed_page = None
+            self.preview_label.setText(f"Error rendering page:\n{message}")
+
+    def show_preview(self, page_num, pixmap):
+        self.displayed_page = page_num
+        self.preview_label.setPixmap(pixmap)
+
+    @staticmethod
+    def cache_put(cache, key, value):
+        cache[key] = value
+        if len(cache) > PREVIEW_CACHE_SIZE:
+            cache.popitem(last=False)
+
     def show_prev_page(self):
         if self.current_preview_index > 0:
             self.current_preview_index -= 1
@@ -304,10 +616,32 @@ class PrintDialog(QDialog):
             self.current_preview_index += 1
             self.render_current_preview_page()
 
+    def done(self, result):
+        """Releases the document and MuPDF's cached resources however the dialog is dismissed."""
+        # Results still in flight must not touch the closing dialog; queued ones need not run at all
+        self.wanted_preview = None
+        for job in self.pending_renders.values():
+            job.cancel()
+        self.pending_renders.clear()
+        if self.doc is not None:
+            import fitz  # PyMuPDF
+            with MUPDF_LOCK:
+                self.doc.close()
+                self.doc = None
+                fitz.TOOLS.store_shrink(100)
+        super().done(result)
+
     def load_document(self):
+        if self.doc is not None:
+            # Already open; keep the handle and the previews rendered from it
+            return
+        self.preview_cache.clear()
         try:
             if self.file_path.lower().endswith('.pdf'):
-                self.doc = fitz.open(self.file_path)
+                # MuPDF is only loaded once there is a PDF to open
+                import fitz  # PyMuPDF
+                # Name the type so MuPDF skips content sniffing
+                self.doc = fitz.open(self.file_path, filetype="pdf")
                 self.total_pages = len(self.doc)
             else:
                 raise ValueError("Unsupported file type")
@@ -317,7 +651,7 @@ class PrintDialog(QDialog):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.render_current_preview_page()
+        self._resize_timer.start()
 
 
 if __name__ == '__main__':